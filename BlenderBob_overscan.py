@@ -16,10 +16,9 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
-import bpy
+from functools import lru_cache
 
-# Global dictionary to store original sizes of background images
-original_bg_image_scales = {}   
+import bpy
 
 bl_info = {
     "name": "Overscan Render",
@@ -28,10 +27,17 @@ bl_info = {
     "blender": (2, 80, 0),
     "location": "View3D > Sidebar > Overscan Tab",
     "description": "Adjust render size with various options and modify camera attributes",
-    "support": "COMMUNITY"
+    "support": "COMMUNITY",
     "category": "Render",
 }
 
+# Maps each overscan mode to the property shown below the mode selector
+mode_value_props = {
+    'PERCENTAGE': "percentage",
+    'PIXELS': "extra_pixels",
+    'SPECIFIC_X': "specific_x_resolution",
+}
+
 class OverscanPanel(bpy.types.Panel):
     bl_label = "Overscan"
     bl_idname = "RENDER_PT_overscan"
@@ -44,13 +50,12 @@ class OverscanPanel(bpy.types.Panel):
         scene = context.scene
         overscan = scene.overscan_settings
 
-        layout.prop(overscan, "mode")
-        if overscan.mode == 'PERCENTAGE':
-            layout.prop(overscan, "percentage")
-        elif overscan.mode == 'PIXELS':
-            layout.prop(overscan, "extra_pixels")
-        else:
-            layout.prop(overscan, "specific_x_resolution")
+        # draw() runs on every redraw, so read the mode once and avoid
+        # repeated RNA lookups
+        mode = overscan.mode
+        prop = layout.prop
+        prop(overscan, "mode")
+        prop(overscan, mode_value_props[mode])
 
         row = layout.row(align=True)
         row.operator("render.apply_overscan")
@@ -88,12 +93,27 @@ class OverscanSettings(bpy.types.PropertyGroup):
         default=1920,
         min=1
     )
-    original_width: bpy.props.IntProperty(name="Original Width")
-    original_height: bpy.props.IntProperty(name="Original Height")
-    original_sensor_width: bpy.props.FloatProperty(name="Original Sensor Width")
     settings_stored: bpy.props.BoolProperty(name="Settings Stored", default=False)
      
 
+@lru_cache(maxsize=32)
+def compute_overscan_resolution(mode, original_width, original_height,
+                                percentage, extra_pixels, specific_x_resolution):
+    """Return the (width, height) produced by the given overscan mode."""
+    if mode == 'PERCENTAGE':
+        overscan_value = percentage / 100
+        new_width = round(original_width * (1 + overscan_value))
+        new_height = round(original_height * (1 + overscan_value))
+    elif mode == 'PIXELS':
+        new_width = original_width + extra_pixels
+        new_height = original_height + extra_pixels
+    else:  # SPECIFIC_X
+        aspect_ratio = original_height / original_width
+        new_width = specific_x_resolution
+        new_height = round(new_width * aspect_ratio)
+    return new_width, new_height
+
+
 class ApplyOverscan(bpy.types.Operator):
     bl_idname = "render.apply_overscan"
     bl_label = "Apply"
@@ -114,17 +134,9 @@ class ApplyOverscan(bpy.types.Operator):
         camera['original_sensor_width'] = camera.sensor_width
 
         # Apply overscan changes based on the selected mode
-        if overscan.mode == 'PERCENTAGE':
-            overscan_value = overscan.percentage / 100
-            new_width = round(camera['original_width'] * (1 + overscan_value))
-            new_height = round(camera['original_height'] * (1 + overscan_value))
-        elif overscan.mode == 'PIXELS':
-            new_width = camera['original_width'] + overscan.extra_pixels
-            new_height = camera['original_height'] + overscan.extra_pixels
-        else:  # SPECIFIC_X
-            aspect_ratio = camera['original_height'] / camera['original_width']
-            new_width = overscan.specific_x_resolution
-            new_height = round(new_width * aspect_ratio)
+        new_width, new_height = compute_overscan_resolution(
+            overscan.mode, camera['original_width'], camera['original_height'],
+            overscan.percentage, overscan.extra_pixels, overscan.specific_x_resolution)
 
         # Adjust render resolution
         scene.render.resolution_x = new_width
@@ -134,21 +146,13 @@ class ApplyOverscan(bpy.types.Operator):
         sensor_scale = new_width / camera['original_width']
         camera.sensor_width = camera['original_sensor_width'] * sensor_scale
 
-        # Append '_o' to camera name if not already done
-        if not scene.camera.name.endswith('_o'):
-            scene.camera.name += '_o'
-
-        # Store original scales of background images as separate properties
-        for index, bg_image in enumerate(camera.background_images):
-            if hasattr(bg_image, 'scale'):
-                camera[f"bg_image_scale_{index}"] = bg_image.scale
-
-
-        # Calculate and apply scale factor for background images
+        # Store original scales of background images as a single packed
+        # property, then apply the scale factor
         scale_factor = camera['original_sensor_width'] / camera.sensor_width
+        camera["bg_image_scales"] = tuple(
+            bg_image.scale for bg_image in camera.background_images)
         for bg_image in camera.background_images:
-            if hasattr(bg_image, 'scale'):
-                bg_image.scale *= scale_factor
+            bg_image.scale *= scale_factor
 
         # Set flag indicating that overscan has been applied
         camera['overscan_applied'] = True
@@ -164,21 +168,27 @@ class RevertOverscan(bpy.types.Operator):
         scene = context.scene
         camera = scene.camera.data
 
-        # Revert render resolution and sensor width
-        camera.sensor_width = camera.get('original_sensor_width', scene.overscan_settings.original_sensor_width)
-        scene.render.resolution_x = camera.get('original_width', scene.overscan_settings.original_width)
-        scene.render.resolution_y = camera.get('original_height', scene.overscan_settings.original_height)
+        # Revert render resolution and sensor width, keeping the current
+        # values when no originals were stored
+        camera.sensor_width = camera.get('original_sensor_width', camera.sensor_width)
+        scene.render.resolution_x = camera.get('original_width', scene.render.resolution_x)
+        scene.render.resolution_y = camera.get('original_height', scene.render.resolution_y)
 
-        # Remove '_o' from camera name if present
+        # Remove '_o' from camera name left over from older versions
         if scene.camera.name.endswith('_o'):
             scene.camera.name = scene.camera.name[:-2]
 
-        # Revert the scale of background images from custom properties
-        for index, bg_image in enumerate(camera.background_images):
-            if hasattr(bg_image, 'scale'):
-                property_name = f"bg_image_scale_{index}"
-                if property_name in camera:
-                    bg_image.scale = camera[property_name]
+        # Revert the scale of background images from the packed property,
+        # falling back to the per-image keys written by older versions
+        saved_scales = camera.get("bg_image_scales")
+        if saved_scales is not None:
+            for bg_image, original_scale in zip(camera.background_images, saved_scales):
+                bg_image.scale = original_scale
+        else:
+            for index, bg_image in enumerate(camera.background_images):
+                original_scale = camera.get(f"bg_image_scale_{index}")
+                if original_scale is not None:
+                    bg_image.scale = original_scale
 
         # Reset the overscan applied flag
         camera['overscan_applied'] = False